@@ -6,3 +6,8 @@ train_features_path = output_directory_path + "train_features.csv"
 train_labels_path = output_directory_path + "train_labels.csv"
 test_features_path = output_directory_path + "test_features.csv"
 rf_model_path = output_directory_path + "rf_model.pkl"
+
+# Entraînement distribué : nombre de workers locaux et variable d'environnement
+# contenant la clé partagée entre le coordinateur et les workers distants
+distributed_n_workers = 4
+distributed_authkey_env = "TITANIC_RF_AUTHKEY"
@@ -0,0 +1,350 @@
+# distributed_training.py
+import argparse
+import logging
+import multiprocessing
+import os
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from model_training import save_model
+from config import (
+    train_features_path,
+    train_labels_path,
+    rf_model_path,
+    distributed_n_workers,
+    distributed_authkey_env,
+)
+
+# Configuration du logging pour suivre les événements du processus
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+def split_estimators(n_estimators: int, n_workers: int) -> list[int]:
+    """Répartit le nombre d'arbres de la forêt entre les workers.
+
+    Args:
+        n_estimators (int): Nombre total d'arbres de la forêt.
+        n_workers (int): Nombre de workers.
+
+    Returns:
+        list[int]: Nombre d'arbres attribué à chaque worker.
+
+    Raises:
+        ValueError: S'il y a moins d'arbres que de workers.
+    """
+    if n_workers < 1 or n_estimators < n_workers:
+        raise ValueError(
+            f"Impossible de répartir {n_estimators} arbres sur {n_workers} workers."
+        )
+    base, reste = divmod(n_estimators, n_workers)
+    return [base + 1 if rank < reste else base for rank in range(n_workers)]
+
+
+def read_feature_slice(
+    features_path: str, labels_path: str, rank: int, n_workers: int
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Lit la tranche des données prétraitées attribuée à un worker.
+
+    Le worker de rang `rank` ne lit que les lignes d'indice
+    `rank`, `rank + n_workers`, `rank + 2 * n_workers`, etc.
+
+    Args:
+        features_path (str): Chemin du fichier des caractéristiques.
+        labels_path (str): Chemin du fichier des étiquettes.
+        rank (int): Rang du worker.
+        n_workers (int): Nombre total de workers.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series]: Caractéristiques et étiquettes
+        de la tranche.
+    """
+
+    def hors_tranche(i):
+        # La ligne 0 est l'en-tête, elle est toujours conservée
+        return i > 0 and (i - 1) % n_workers != rank
+
+    X = pd.read_csv(features_path, skiprows=hors_tranche)
+    y = pd.read_csv(labels_path, skiprows=hors_tranche)
+    return X, y.iloc[:, 0]
+
+
+def fit_sub_forest(task: dict) -> RandomForestClassifier:
+    """Entraîne la sous-forêt décrite par une tâche du coordinateur.
+
+    Args:
+        task (dict): Chemins des données, rang du worker, nombre de workers
+            et hyperparamètres de la sous-forêt.
+
+    Returns:
+        RandomForestClassifier: La sous-forêt entraînée.
+    """
+    X, y = read_feature_slice(
+        task["features_path"], task["labels_path"], task["rank"], task["n_workers"]
+    )
+    model = RandomForestClassifier(
+        n_estimators=task["n_estimators"],
+        max_depth=task["max_depth"],
+        random_state=task["random_state"],
+    )
+    model.fit(X, y.values)
+    logging.info(
+        f"Worker {task['rank']} : {task['n_estimators']} arbres entraînés "
+        f"sur {len(X)} lignes."
+    )
+    return model
+
+
+def answer_task(conn, task: dict) -> None:
+    """Exécute une tâche reçue par un worker et renvoie son résultat.
+
+    Args:
+        conn (Connection): Connexion avec le coordinateur.
+        task (dict): Tâche à exécuter.
+    """
+    try:
+        conn.send(("ok", fit_sub_forest(task)))
+    except Exception as e:
+        logging.error(f"Erreur lors de l'exécution de la tâche : {e}")
+        try:
+            conn.send(("error", repr(e)))
+        except Exception as e:
+            logging.error(f"Impossible de renvoyer l'erreur au coordinateur : {e}")
+
+
+def serve_worker(address, authkey: bytes, ready=None):
+    """Lance un worker qui écoute les tâches sur un socket.
+
+    Chaque connexion transporte une tâche ; la tâche `None` arrête le worker.
+    Une connexion refusée ou interrompue est journalisée sans arrêter le worker.
+
+    Args:
+        address (tuple): Adresse (hôte, port) d'écoute, le port 0 laissant
+            le système en choisir un.
+        authkey (bytes): Clé d'authentification partagée avec le coordinateur.
+        ready (Connection, optional): Extrémité de pipe sur laquelle envoyer
+            l'adresse effective une fois le worker à l'écoute.
+    """
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.send(listener.address)
+            ready.close()
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                logging.error(f"Connexion refusée : {e}")
+                continue
+            with conn:
+                try:
+                    task = conn.recv()
+                except Exception as e:
+                    logging.error(f"Erreur lors de la réception de la tâche : {e}")
+                    continue
+                if task is None:
+                    break
+                answer_task(conn, task)
+
+
+def start_local_workers(n_workers: int, authkey: bytes) -> tuple[list, list]:
+    """Démarre des workers locaux, chacun dans son propre processus.
+
+    Args:
+        n_workers (int): Nombre de workers à démarrer.
+        authkey (bytes): Clé d'authentification partagée.
+
+    Returns:
+        tuple[list, list]: Les processus démarrés et leurs adresses.
+    """
+    processes, addresses = [], []
+    for _ in range(n_workers):
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=serve_worker,
+            args=(("localhost", 0), authkey, child_conn),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        addresses.append(parent_conn.recv())
+        parent_conn.close()
+        processes.append(process)
+    logging.info(f"{n_workers} workers locaux démarrés : {addresses}")
+    return processes, addresses
+
+
+def stop_workers(addresses: list, authkey: bytes) -> None:
+    """Demande l'arrêt des workers.
+
+    Args:
+        addresses (list): Adresses des workers.
+        authkey (bytes): Clé d'authentification partagée.
+    """
+    for address in addresses:
+        with Client(address, authkey=authkey) as conn:
+            conn.send(None)
+
+
+def merge_forests(forests: list) -> RandomForestClassifier:
+    """Fusionne plusieurs sous-forêts en un seul estimateur.
+
+    Args:
+        forests (list): Sous-forêts entraînées sur les mêmes caractéristiques.
+
+    Returns:
+        RandomForestClassifier: La forêt contenant l'ensemble des arbres.
+
+    Raises:
+        ValueError: Si les sous-forêts n'ont pas les mêmes classes
+            ou caractéristiques.
+    """
+    merged = forests[0]
+    for forest in forests[1:]:
+        if not np.array_equal(forest.classes_, merged.classes_):
+            raise ValueError("Les sous-forêts n'ont pas les mêmes classes.")
+        if forest.n_features_in_ != merged.n_features_in_:
+            raise ValueError("Les sous-forêts n'ont pas les mêmes caractéristiques.")
+    merged.estimators_ = [tree for forest in forests for tree in forest.estimators_]
+    merged.n_estimators = len(merged.estimators_)
+    return merged
+
+
+def train_model_distributed(
+    addresses: list,
+    authkey: bytes,
+    features_path: str = train_features_path,
+    labels_path: str = train_labels_path,
+    n_estimators: int = 100,
+    max_depth: int = 5,
+    random_state: int = 1,
+) -> RandomForestClassifier:
+    """Entraîne un RandomForestClassifier réparti sur plusieurs workers.
+
+    Chaque worker entraîne une partie des arbres, avec sa propre graine,
+    sur sa tranche des données ; les sous-forêts sont ensuite fusionnées.
+
+    Args:
+        addresses (list): Adresses des workers.
+        authkey (bytes): Clé d'authentification partagée.
+        features_path (str): Chemin du fichier des caractéristiques.
+        labels_path (str): Chemin du fichier des étiquettes.
+        n_estimators (int): Nombre total d'arbres.
+        max_depth (int): Profondeur maximale des arbres.
+        random_state (int): Graine de base, décalée du rang de chaque worker.
+
+    Returns:
+        RandomForestClassifier: Le modèle fusionné.
+    """
+    n_workers = len(addresses)
+    connections = []
+    try:
+        # Envoi de toutes les tâches avant d'attendre les résultats
+        for rank, (address, n_trees) in enumerate(
+            zip(addresses, split_estimators(n_estimators, n_workers))
+        ):
+            conn = Client(address, authkey=authkey)
+            connections.append(conn)
+            conn.send(
+                {
+                    "features_path": features_path,
+                    "labels_path": labels_path,
+                    "rank": rank,
+                    "n_workers": n_workers,
+                    "n_estimators": n_trees,
+                    "max_depth": max_depth,
+                    "random_state": random_state + rank,
+                }
+            )
+        forests = []
+        for rank, conn in enumerate(connections):
+            status, result = conn.recv()
+            if status != "ok":
+                raise RuntimeError(f"Échec du worker {rank} : {result}")
+            forests.append(result)
+        model = merge_forests(forests)
+        logging.info(f"Modèle distribué entraîné sur {n_workers} workers.")
+        return model
+    except Exception as e:
+        logging.error(f"Erreur lors de l'entraînement distribué : {e}")
+        raise
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def parse_address(value: str) -> tuple[str, int]:
+    """Convertit une adresse `hôte:port` en tuple (hôte, port)."""
+    host, port = value.rsplit(":", 1)
+    return host, int(port)
+
+
+def resolve_authkey(value: str | None) -> bytes:
+    """Détermine la clé d'authentification partagée avec les workers.
+
+    Args:
+        value (str | None): Clé passée en ligne de commande, prioritaire
+            sur la variable d'environnement.
+
+    Returns:
+        bytes: La clé d'authentification.
+
+    Raises:
+        ValueError: Si aucune clé n'est fournie.
+    """
+    value = value or os.environ.get(distributed_authkey_env)
+    if not value:
+        raise ValueError(
+            "Clé d'authentification manquante : utilisez --authkey ou "
+            f"la variable d'environnement {distributed_authkey_env}."
+        )
+    return value.encode()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Entraînement distribué")
+    parser.add_argument(
+        "--worker", type=parse_address, help="Lance un worker sur hôte:port"
+    )
+    parser.add_argument(
+        "--workers",
+        type=lambda v: [parse_address(a) for a in v.split(",")],
+        help="Adresses hôte:port des workers distants, séparées par des virgules",
+    )
+    parser.add_argument(
+        "--authkey",
+        help="Clé partagée avec les workers distants (de préférence via la "
+        f"variable d'environnement {distributed_authkey_env})",
+    )
+    args = parser.parse_args()
+
+    if args.worker or args.workers:
+        try:
+            authkey = resolve_authkey(args.authkey)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        # Workers locaux : clé aléatoire propre à cette exécution
+        authkey = os.urandom(32)
+
+    try:
+        if args.worker:
+            serve_worker(args.worker, authkey)
+        else:
+            # Sans workers distants, démarrage de workers locaux
+            processes, addresses = [], args.workers
+            if not addresses:
+                processes, addresses = start_local_workers(
+                    distributed_n_workers, authkey
+                )
+            try:
+                model = train_model_distributed(addresses, authkey)
+            finally:
+                if processes:
+                    stop_workers(addresses, authkey)
+            save_model(model, rf_model_path)
+            logging.info("Modèle entraîné et sauvegardé avec succès.")
+    except Exception as e:
+        logging.critical(f"Échec du traitement : {e}")
@@ -17,6 +17,19 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "s
 from data_preprocessing import preprocess_data
 from model_training import train_model
 from model_evaluation import evaluate_model
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from distributed_training import (
+    fit_sub_forest,
+    merge_forests,
+    read_feature_slice,
+    split_estimators,
+    start_local_workers,
+    stop_workers,
+    train_model_distributed,
+)
+
+AUTHKEY = b"cle-de-test"
 
 
 # Fixtures pour les tests
@@ -124,6 +137,154 @@ def test_train_model(sample_data):
     assert len(prediction) == X.shape[0]
 
 
+# Tests pour distributed_training.py
+def test_split_estimators():
+    """
+    Teste la répartition des arbres entre les workers.
+
+    Vérifie:
+        - La conservation du nombre total d'arbres
+        - Le rejet d'une répartition impossible
+    """
+    assert split_estimators(10, 3) == [4, 3, 3]
+    with pytest.raises(ValueError):
+        split_estimators(2, 3)
+
+
+@pytest.fixture
+def feature_store(sample_data, tmp_path):
+    """
+    Sauvegarde les données prétraitées de test comme le ferait le module 1.
+
+    Returns:
+        tuple: (features_path, labels_path, X_test)
+    """
+    train_data, test_data = sample_data
+    X, y, X_test = preprocess_data(train_data, test_data)
+    features_path = tmp_path / "train_features.csv"
+    labels_path = tmp_path / "train_labels.csv"
+    X.to_csv(features_path, index=False)
+    y.to_csv(labels_path, index=False)
+    return str(features_path), str(labels_path), X_test
+
+
+def test_read_feature_slice(feature_store):
+    """
+    Teste la lecture des tranches de données par les workers.
+
+    Vérifie:
+        - Les tranches des workers sont disjointes
+        - Leur réunion couvre toutes les lignes, étiquettes comprises
+    """
+    features_path, labels_path, _ = feature_store
+    X = pd.read_csv(features_path)
+    y = pd.read_csv(labels_path).iloc[:, 0]
+
+    slices = [read_feature_slice(features_path, labels_path, r, 3) for r in range(3)]
+    assert [len(X_slice) for X_slice, _ in slices] == [2, 1, 1]
+    assert [y_slice.tolist() for _, y_slice in slices] == [
+        y.iloc[r::3].tolist() for r in range(3)
+    ]
+    X_merged = pd.concat([X_slice for X_slice, _ in slices])
+    assert len(X_merged) == len(X)
+    assert X_merged.sort_values(list(X.columns)).values.tolist() == (
+        X.sort_values(list(X.columns)).values.tolist()
+    )
+
+
+def test_merge_forests(sample_data):
+    """
+    Teste la fusion des sous-forêts.
+
+    Vérifie:
+        - Le nombre d'arbres de la forêt fusionnée
+        - Le rejet de sous-forêts aux classes ou caractéristiques différentes
+    """
+    train_data, test_data = sample_data
+    X, y, _ = preprocess_data(train_data, test_data)
+    forests = [train_model(X, y), train_model(X, y)]
+    assert len(merge_forests(forests).estimators_) == 200
+
+    with pytest.raises(ValueError):
+        merge_forests([train_model(X, y), train_model(X, y.replace(0, 2))])
+    with pytest.raises(ValueError):
+        merge_forests([train_model(X, y), train_model(X.iloc[:, 1:], y)])
+
+
+def test_train_model_distributed(feature_store):
+    """
+    Teste l'entraînement distribué sur des workers locaux.
+
+    Args:
+        feature_store (tuple): Données prétraitées générées par la fixture
+
+    Vérifie:
+        - La fusion des sous-forêts en un seul modèle
+        - Une graine différente par worker (random_state + rang)
+        - La capacité du modèle fusionné à générer des prédictions
+    """
+    features_path, labels_path, X_test = feature_store
+
+    processes, addresses = start_local_workers(2, AUTHKEY)
+    try:
+        model = train_model_distributed(
+            addresses, AUTHKEY, features_path, labels_path, n_estimators=11
+        )
+    finally:
+        stop_workers(addresses, AUTHKEY)
+        for process in processes:
+            process.join()
+
+    # Les arbres doivent être ceux de sous-forêts entraînées avec les graines 1 et 2
+    expected_seeds = []
+    for rank, n_trees in enumerate([6, 5]):
+        forest = fit_sub_forest(
+            {
+                "features_path": features_path,
+                "labels_path": labels_path,
+                "rank": rank,
+                "n_workers": 2,
+                "n_estimators": n_trees,
+                "max_depth": 5,
+                "random_state": 1 + rank,
+            }
+        )
+        expected_seeds += [tree.random_state for tree in forest.estimators_]
+    assert [tree.random_state for tree in model.estimators_] == expected_seeds
+    predictions = model.predict(X_test)
+    assert len(predictions) == X_test.shape[0]
+    assert all(pred in [0, 1] for pred in predictions)
+
+
+def test_worker_survives_bad_connections(feature_store):
+    """
+    Teste la résistance d'un worker aux connexions invalides.
+
+    Args:
+        feature_store (tuple): Données prétraitées générées par la fixture
+
+    Vérifie:
+        - Le rejet d'un client utilisant une mauvaise clé
+        - La poursuite du service après une connexion refusée ou interrompue
+    """
+    features_path, labels_path, _ = feature_store
+
+    processes, addresses = start_local_workers(1, AUTHKEY)
+    try:
+        with pytest.raises(AuthenticationError):
+            Client(addresses[0], authkey=b"mauvaise-cle")
+        Client(addresses[0], authkey=AUTHKEY).close()
+
+        model = train_model_distributed(
+            addresses, AUTHKEY, features_path, labels_path, n_estimators=3
+        )
+        assert len(model.estimators_) == 3
+    finally:
+        stop_workers(addresses, AUTHKEY)
+        for process in processes:
+            process.join()
+
+
 # Tests pour model_evaluation.py
 def test_evaluate_model(sample_data):
     """